@@ -95,3 +95,10 @@ def test_convert_all_docs_logs_conversion(tmp_path, caplog):
     assert any(
         "Converting" in message and TEST_DOCX_FILE.name in message for message in caplog.messages
     )
+
+
+def test_convert_all_docs_writes_html_files(tmp_path):
+    convert_all_docs(input_dir=TEST_DOCS_DIR, output_dir=tmp_path, print_html=False, max_workers=2)
+    output_path = tmp_path / f"{TEST_DOCX_FILE.stem}.html"
+    assert output_path.exists()
+    assert "<h1>Heading level 1</h1>" in output_path.read_text(encoding="utf-8")
@@ -30,6 +30,12 @@ VALID_HTML_CASES = [
         </li>
         <li>Item 3</li>
     </ul>""",
+    # Tags in attribute values are not tags
+    '<p title="<b>">x</p>',
+    '<a href="/x?q=<em>">x</a>',
+    '<a title="x<b">x</a>',
+    # Tag names are case-insensitive
+    "<P>Upper case opening tag</p>",
     # Mixed content
     "<p>Text before</p><ul><li>Item</li></ul><p>Text after</p>",
     # Complex nesting
@@ -55,6 +61,7 @@ INVALID_HTML_CASES = [
     # Disallowed tags
     ("<div>Not allowed</div>", "Tag 'div' is not allowed"),
     ("<p><span>Span not allowed</span></p>", "Tag 'span' is not allowed"),
+    ("<DIV>Upper case</DIV>", "Tag 'div' is not allowed"),
     # BR tags
     ("<p>Line 1<br>Line 2</p>", "Tag 'br' is not allowed"),
     # Invalid list structure
@@ -64,17 +71,27 @@ INVALID_HTML_CASES = [
     ("<p></p>", "Empty or nested <p> tags are not allowed"),
     ("<p>   </p>", "Empty or nested <p> tags are not allowed"),
     ("<p>One, then <p>Nested</p></p>", "Empty or nested <p> tags are not allowed"),
+    ("<p>Heading <h1>in paragraph</h1></p>", "Empty or nested <p> tags are not allowed"),
+    ("<p><ul><li>List in paragraph</li></ul></p>", "Empty or nested <p> tags are not allowed"),
     # Text at root level
     ("Text not in paragraph", "Text must be wrapped in a block element"),
     ("<p>Paragraph</p>And some text", "Text must be wrapped in a block element"),
+    ("<body><p>Paragraph</p></body>Text after body", "Text must be wrapped in a block element"),
+    (
+        "<html><body><p>Paragraph</p></body></html>Text after html",
+        "Text must be wrapped in a block element",
+    ),
     # Unescaped ampersand
     ("<p>AT&T</p>", "Text contains unescaped &: &T</p>"),
     ("<p>Invalid entity: &invalid;</p>", "Invalid HTML entity: &invalid; in: &invalid;</p>"),
     ("<p>Missing semicolon: &amp</p>", "Text contains unescaped &: &amp</p>"),
+    ("<p><a href='/x?a=1&b=2'>x</a></p>", "Text contains unescaped &: &b=2"),
     # Unclosed tags
     ("<p>Unclosed tag<p>", "Empty or nested <p> tags are not allowed"),
     ("<p>Invalid <tag</p>", "Tag 'tag<' is not allowed"),
     ("<p>Text <b>bold text</p> more text", "Unclosed tags found"),
+    ("<p><b><i>Overlapping</b></i></p>", "Unclosed tags found:i"),
+    ("<p>Stray closing tag</b></p>", "Unclosed tags found:b"),
     # Unescaped < signs in content (must be &lt;)
     ("<p>5 < 10</p>", "Unescaped '<' found in text content. Use '&lt;' instead."),
     ("<p>if x < 5: print(x)</p>", "Unescaped '<' found in text content. Use '&lt;' instead."),
@@ -145,3 +162,17 @@ def test_validate_html_with_unescaped_ampersand_without_semicolon():
     invalid_html = "<p>Ends with ampersand &"
     with pytest.raises(ParsingError, match=r"Text contains unescaped &: &"):
         validate_html(invalid_html, is_text_at_root_level_allowed=False)
+
+
+def test_validate_html_with_custom_allowed_tags():
+    # Any iterable will do, even one that can only be consumed once
+    allowed_tags = (tag for tag in ("html", "head", "body", "p", "b"))
+    validate_html("<p>Text with <b>bold</b></p>", allowed_tags=allowed_tags)
+
+    with pytest.raises(ParsingError, match=r"Tag 'i' is not allowed. Only <body>, <head>"):
+        validate_html("<p>Text with <i>italic</i></p>", allowed_tags=["html", "head", "body", "p"])
+
+
+def test_validate_html_with_allowed_void_tags():
+    allowed_tags = ("html", "head", "body", "p", "br")
+    validate_html("<p>Line 1<br>Line 2<br/>Line 3</p>", allowed_tags=allowed_tags)
@@ -72,3 +72,9 @@ def test_read_json_toml_yaml_raises_parser_error_for_empty_toml():
     for empty_file in ("json_empty.json", "toml_empty.toml", "yaml_empty.yaml"):
         with pytest.raises(ParsingError, match="malformed data"):
             read_json_toml_yaml(DIR_WITH_TEST_FILES / empty_file)
+
+
+def test_read_json_toml_yaml_keeps_big_integers_in_json(tmp_path):
+    file = tmp_path / "big_integer.json"
+    file.write_text('{"key": 123456789012345678901234567890}', encoding="utf-8")
+    assert read_json_toml_yaml(file) == {"key": 123456789012345678901234567890}
@@ -63,6 +63,66 @@ def test_move_line_throws_exception_with_wrong_string():
         )
 
 
+@pytest.mark.parametrize(
+    "line_number_to_cut, line_number_to_insert_before, expected_output",
+    [
+        (-1, 0, "baz\nfoo\nbar\n"),
+        (0, -1, "bar\nfoo\nbaz\n"),
+        (-3, "END", "bar\nbaz\nfoo\n"),
+    ],
+)
+def test_move_line_with_negative_line_numbers(
+    tmp_path, line_number_to_cut, line_number_to_insert_before, expected_output
+):
+    file = tmp_path / "file.txt"
+    file.write_text("foo\nbar\nbaz\n", encoding="utf-8")
+
+    move_line(
+        file=file,
+        line_number_to_cut=line_number_to_cut,
+        line_number_to_insert_before=line_number_to_insert_before,
+    )
+
+    assert file.read_text(encoding="utf-8") == expected_output
+
+
+def test_move_line_writes_to_output_file(tmp_path):
+    file = tmp_path / "file.txt"
+    file.write_text("foo\nbar\n", encoding="utf-8")
+    output_file = tmp_path / "output.txt"
+
+    move_line(
+        file=file, line_number_to_cut=1, line_number_to_insert_before=0, output_file=output_file
+    )
+
+    assert output_file.read_text(encoding="utf-8") == "bar\nfoo\n"
+    assert file.read_text(encoding="utf-8") == "foo\nbar\n"
+
+
+def test_move_line_in_symlinked_file(tmp_path):
+    file = tmp_path / "file.txt"
+    file.write_text("foo\nbar\n", encoding="utf-8")
+    link = tmp_path / "link.txt"
+    link.symlink_to(file)
+
+    move_line(file=link, line_number_to_cut=1, line_number_to_insert_before=0)
+
+    assert link.is_symlink()
+    assert file.read_text(encoding="utf-8") == "bar\nfoo\n"
+
+
+def test_move_line_throws_exception_with_line_number_out_of_range(tmp_path):
+    file = tmp_path / "file.txt"
+    file.write_text("foo\nbar\n", encoding="utf-8")
+
+    with pytest.raises(IndexError, match="Line number 2 is out of range"):
+        move_line(file=file, line_number_to_cut=2, line_number_to_insert_before=0)
+
+    # original file is left intact, no temporary files are left behind
+    assert file.read_text(encoding="utf-8") == "foo\nbar\n"
+    assert list(tmp_path.iterdir()) == [file]
+
+
 def test_read_non_empty_lines_from_txt_file():
     lines = [" foo \n", "bar\n", "\n", "баз \n"]
 
@@ -77,6 +137,11 @@ def test_read_non_empty_lines_from_txt_file():
     PATH_TO_TEST_OUTPUT_TXT_FILE.unlink()
 
 
+def test_read_non_empty_lines_from_txt_file_in_different_encodings():
+    for file in DIR_WITH_TEST_FILES.glob("read_plain_text*.txt"):
+        assert read_non_empty_lines_from_txt_file(file) == ["foo bar", "фу бар"]
+
+
 def test_read_non_empty_lines_from_txt_file_raises_file_not_found():
     non_existent_file = Path("non_existent_file.txt")
     with pytest.raises(FileNotFoundError) as exc_info:
@@ -91,6 +156,12 @@ def test_read_plain_text_from_file():
         assert read_plain_text_from_file(file) == "foo bar\nфу бар"
 
 
+def test_read_plain_text_from_file_translates_newlines(tmp_path):
+    file = tmp_path / "windows_newlines.txt"
+    file.write_bytes("foo bar\r\nфу бар\r\n".encode("cp1251"))
+    assert read_plain_text_from_file(file) == "foo bar\nфу бар\n"
+
+
 def test_remove_extra_space():
     for str_ in (
         "foo bar",
@@ -108,6 +179,8 @@ def test_remove_extra_space():
     [
         ("foo bar", "foo bar"),
         (["foo", "bar"], "foo\nbar\n"),
+        (("foo", "bar"), "foo\nbar\n"),
+        ([], ""),
     ],
 )
 def test_write_plain_text_to_file_writes_content_to_file(content, expected_output):
@@ -5,13 +5,19 @@ from bs4 import BeautifulSoup, Tag
 
 from tinybear.exceptions import ParsingError
 
-TAG_PATTERN = re.compile(r"<(/?\w+)[^>]*>")
-UNESCAPED_LTE_PATTERN = re.compile(r"<(?![a-zA-Z/])")
-
-
-def validate_html(
-    html: str,
-    allowed_tags: Iterable[str] = (
+# Everything in raw HTML that needs checking: opening or closing tag
+# (tag name as HTML tokenizer sees it: up to whitespace, "/" or ">"),
+# solitary "<" (not followed by a letter or an "/") and "&".
+# A tag is consumed up to its ">", skipping quoted attribute values,
+# so that "<" inside them is never taken for the start of another tag.
+TOKEN_PATTERN = re.compile(
+    r"<(?P<closing>/?)(?P<tag_name>[a-zA-Z][^\s/>]*)(?:\"[^\"]*\"|'[^']*'|[^'\">])*>?"
+    r"|(?P<less_than><(?![a-zA-Z/]))|&"
+)
+ENTITY_PATTERN = re.compile(r"&(?:#\d+|amp|lt|gt|quot|apos);")
+
+DEFAULT_ALLOWED_TAGS = frozenset(
+    {
         "a",
         "b",
         "body",
@@ -34,7 +40,69 @@ def validate_html(
         "title",
         "u",
         "ul",
-    ),
+    }
+)
+
+# Opening any of these tags implicitly closes an open <p> (per HTML spec), so they
+# cannot be nested in a paragraph.
+TAGS_CLOSING_PARAGRAPH = frozenset(
+    {
+        "address",
+        "article",
+        "aside",
+        "blockquote",
+        "details",
+        "div",
+        "dl",
+        "fieldset",
+        "figcaption",
+        "figure",
+        "footer",
+        "form",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "header",
+        "hgroup",
+        "hr",
+        "main",
+        "menu",
+        "nav",
+        "ol",
+        "p",
+        "pre",
+        "section",
+        "table",
+        "ul",
+    }
+)
+
+# Tags that have no content and therefore no closing tag
+VOID_TAGS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+
+def validate_html(
+    html: str,
+    allowed_tags: Iterable[str] = DEFAULT_ALLOWED_TAGS,
     is_text_at_root_level_allowed: bool = False,
 ) -> None:
     """
@@ -53,52 +121,30 @@ def validate_html(
     if not html:
         return  # Empty string is valid
 
-    _check_for_unescaped_ampersand(html)
-    _check_for_unescaped_less_than(html)
+    # membership is checked for every tag, so make it O(1) whatever iterable was passed
+    allowed_tag_set = frozenset(allowed_tags)
 
-    soup = BeautifulSoup(html, "html5lib")
+    _check_raw_html(html=html, allowed_tags=allowed_tag_set)
 
-    _check_all_tags_are_allowed(soup=soup, allowed_tags=allowed_tags)
-    _check_list_structure(soup)
-    _check_paragraphs(soup)
+    soup = BeautifulSoup(html, "lxml")
 
-    _check_for_unclosed_tags(html)
+    _check_tags(soup=soup, allowed_tags=allowed_tag_set)
 
     if not is_text_at_root_level_allowed:
         _check_for_root_level_text(soup)
 
 
-def _check_all_tags_are_allowed(soup: BeautifulSoup, allowed_tags: Iterable[str]) -> None:
-    """Validate that only allowed tags are present in the HTML."""
-    for tag in soup.find_all(True):
-        if tag.name not in allowed_tags:
-            raise ParsingError(
-                f"Tag '{tag.name}' is not allowed. "
-                f"Only {', '.join(f'<{t}>' for t in sorted(allowed_tags))} are allowed."
-            )
-
+def _check_entity_with_ampersand(html: str, position: int) -> None:
+    """Validate that an HTML entity starting at given position is properly formatted."""
+    if ENTITY_PATTERN.match(html, position) is not None:
+        return
 
-def _check_entity_with_ampersand(html: str, position: int) -> int:
-    """Validate that an HTML entity is properly formatted.
-    Return the position of the semicolon that closes the entity.
-    """
     semicolon_pos = html.find(";", position + 1)
     if semicolon_pos == -1:
         raise ParsingError(f"Text contains unescaped &: {html[position:position + 50]}...")
 
     entity = html[position + 1 : semicolon_pos]
-    if not (entity.startswith("#") and entity[1:].isdigit()) and entity not in [
-        "amp",
-        "lt",
-        "gt",
-        "quot",
-        "apos",
-    ]:
-        raise ParsingError(
-            f"Invalid HTML entity: &{entity}; in: {html[position:position + 50]}..."
-        )
-
-    return semicolon_pos
+    raise ParsingError(f"Invalid HTML entity: &{entity}; in: {html[position:position + 50]}...")
 
 
 def _check_for_root_level_text(soup: BeautifulSoup) -> None:
@@ -107,77 +153,104 @@ def _check_for_root_level_text(soup: BeautifulSoup) -> None:
     This function checks for text nodes that are not properly wrapped in block elements.
     It allows text in certain inline elements but requires other text to be in block elements.
     """
-    # First check direct children of the root for any text nodes
-    body = soup.find("body")  # even if there's no <body> tag, html5lib will wrap content in one
-    for child in body.children:
-        if isinstance(child, str) and child.strip():
-            raise ParsingError("Text must be wrapped in a block element")
-
-
-def _check_for_unescaped_ampersand(html: str) -> None:
-    """Check that there are no unescaped ampersands."""
-    position = 0
-
-    while position < len(html):
-        if html[position] == "&":
-            semicolon_pos = _check_entity_with_ampersand(html, position)
-            position = semicolon_pos + 1
-        else:
-            position += 1
-
-
-def _check_for_unescaped_less_than(html: str) -> None:
-    """Check for a solitary '<' in the text content (not followed by a letter or an "/")."""
-    if UNESCAPED_LTE_PATTERN.search(html):
-        raise ParsingError("Unescaped '<' found in text content. Use '&lt;' instead.")
-
-
-def _check_for_unclosed_tags(html: str) -> None:
-    # Extract all tags from the string
-    tags = TAG_PATTERN.findall(html)
-    # Count opening and closing tags
-    tag_counts: dict[str, int] = {}
-    for tag in tags:
-        if tag.startswith("/"):
-            tag_name = tag[1:]
-            tag_counts[tag_name] = tag_counts.get(tag_name, 0) - 1
-        else:
-            tag_counts[tag] = tag_counts.get(tag, 0) + 1
-    # Tags with non-zero count are unbalanced
-    unclosed = [tag for tag, count in tag_counts.items() if count != 0]
-
-    if unclosed:
-        raise ParsingError(f"Unclosed tags found:{', '.join(unclosed)}")
-
-
-def _check_list_structure(soup: BeautifulSoup) -> None:
-    """Validate the structure of lists and list items."""
-    # Check list structure
-    for list_tag in soup(["ul", "ol"]):
-        for child in list_tag.children:
-            if isinstance(child, Tag) and child.name != "li":
-                raise ParsingError(
-                    f"<{list_tag.name}> can only contain <li> elements, "
-                    f"found <{child.name}>: {child}"
-                )
-
-    # Check that <li> elements are direct children of <ul> or <ol>
-    for li in soup("li"):
-        parent = li.parent
-        if parent.name not in ["ul", "ol"]:
+    # Check direct children of the root for any text nodes. lxml wraps content in <body>
+    # even if there's no such tag, but text after </body> or </html> ends up next to <body>
+    # or in another <html>, and text without any other content stays at the top of the soup.
+    html_tags = soup.find_all("html", recursive=False)
+    roots = [soup, *html_tags]
+    for html_tag in html_tags:
+        roots.extend(html_tag.find_all("body", recursive=False))
+
+    for root in roots:
+        for text in root.find_all(string=True, recursive=False):
+            if text.strip():
+                raise ParsingError("Text must be wrapped in a block element")
+
+
+def _check_raw_html(html: str, allowed_tags: frozenset[str]) -> None:
+    """Check raw HTML in a single pass: validate entities, look for unescaped '<',
+    check names of opening tags (much cheaper than building the tree first)
+    and check that tags are properly closed and not nested in a wrong way.
+    """
+    open_tags: list[str] = []
+
+    for match in TOKEN_PATTERN.finditer(html):
+        if match.group("less_than"):
+            raise ParsingError("Unescaped '<' found in text content. Use '&lt;' instead.")
+
+        tag_name = match.group("tag_name")
+        if tag_name is None:
+            _check_entity_with_ampersand(html, match.start())
+            continue
+
+        tag_name = tag_name.lower()
+
+        # attribute values are skipped by the pattern, but entities in them must be valid too
+        ampersand_pos = html.find("&", match.start(), match.end())
+        while ampersand_pos != -1:
+            _check_entity_with_ampersand(html, ampersand_pos)
+            ampersand_pos = html.find("&", ampersand_pos + 1, match.end())
+
+        if not match.group("closing"):
+            _check_tag_is_allowed(tag_name=tag_name, allowed_tags=allowed_tags)
+            if tag_name in TAGS_CLOSING_PARAGRAPH and "p" in open_tags:
+                raise ParsingError("Empty or nested <p> tags are not allowed")
+            if tag_name not in VOID_TAGS:
+                open_tags.append(tag_name)
+            continue
+
+        if tag_name not in open_tags:
+            raise ParsingError(f"Unclosed tags found:{tag_name}")
+
+        unclosed = []
+        while (open_tag := open_tags.pop()) != tag_name:
+            unclosed.append(open_tag)
+        if unclosed:
+            raise ParsingError(f"Unclosed tags found:{', '.join(unclosed)}")
+
+    if open_tags:
+        raise ParsingError(f"Unclosed tags found:{', '.join(open_tags)}")
+
+
+def _check_tag_is_allowed(tag_name: str, allowed_tags: frozenset[str]) -> None:
+    if tag_name not in allowed_tags:
+        raise ParsingError(
+            f"Tag '{tag_name}' is not allowed. "
+            f"Only {', '.join(f'<{t}>' for t in sorted(allowed_tags))} are allowed."
+        )
+
+
+def _check_tags(soup: BeautifulSoup, allowed_tags: frozenset[str]) -> None:
+    """Validate that only allowed tags are present in the HTML, that lists and
+    list items are properly structured and that paragraphs are not empty.
+    All checks are done in a single walk over the tree.
+    """
+    for tag in soup.descendants:
+        if not isinstance(tag, Tag):
+            continue
+
+        _check_tag_is_allowed(tag_name=tag.name, allowed_tags=allowed_tags)
+
+        parent_name = tag.parent.name  # type: ignore  # every tag in the tree has a parent
+        if parent_name in ("ul", "ol") and tag.name != "li":
+            raise ParsingError(
+                f"<{parent_name}> can only contain <li> elements, found <{tag.name}>: {tag}"
+            )
+
+        if tag.name == "li" and parent_name not in ("ul", "ol"):
             raise ParsingError(
                 f"<li> must be a direct child of <ul> or <ol>, "
-                f"found inside <{parent.name}>: {li}"
+                f"found inside <{parent_name}>: {tag}"
             )
 
+        # Nested paragraphs are caught in raw HTML: parser would transform them
+        # into a sequence of paragraphs.
+        if tag.name == "p" and not _has_non_whitespace_text(tag):
+            raise ParsingError("Empty or nested <p> tags are not allowed")
 
-def _check_paragraphs(soup: BeautifulSoup) -> None:
-    """Validate paragraph structure and content."""
-    paragraphs = soup("p")
 
-    # Check for empty or nested paragraphs
-    # Due to how parser works, nested paragraphs will end up being transformed into
-    # sequence of paragraphs with empty paragraph at the end.
-    for p in paragraphs:
-        if not p.get_text(strip=True):
-            raise ParsingError("Empty or nested <p> tags are not allowed")
+def _has_non_whitespace_text(tag: Tag) -> bool:
+    """Check whether tag contains any non-whitespace text. Unlike `get_text(strip=True)`,
+    stops at the first such string instead of joining all text of the tag.
+    """
+    return any(string.strip() for string in tag.strings)
@@ -1,23 +1,36 @@
 import json
 import logging
 import re
-from collections import Counter
+import sys
 from pathlib import Path
 from typing import Any, Union
 
 # stubs exist but somehow mypy doesn't see them even after installation
-import toml  # type: ignore
 import yaml  # type: ignore
 from yaml.parser import ParserError as YamlParserError  # type: ignore
 
+try:
+    from yaml import CSafeLoader as YamlLoader  # type: ignore
+except ImportError:  # PyYAML was built without libyaml
+    from yaml import SafeLoader as YamlLoader  # type: ignore
+
 from tinybear.exceptions import ParsingError
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
 YAML_INDENT = " " * 2
 
+# An optional hyphen, a colon after the key.
+# The key can be anything but a space or hyphen (to avoid catching lower-level keys)
+PATTERN_FOR_TOP_LEVEL_DICT_KEYS = re.compile(r"^(- )?(?P<key>[^\s-]+)\s?:.*")
 
-def check_yaml_file(path_to_file: Path, verbose: bool = True) -> None:
+
+def check_yaml_file(path_to_file: Path, verbose: bool = True) -> Union[dict[str, Any], list[Any]]:
     """Checks YAML file and throws exception if some problem occurs while
-    reading YAML data.
+    reading YAML data. Returns loaded data.
     """
     if verbose:
         logging.info(f"Checking {path_to_file.name}")
@@ -26,27 +39,23 @@ def check_yaml_file(path_to_file: Path, verbose: bool = True) -> None:
         data = yaml_file.read()
 
     # YAML parser does not catch duplicate dict keys, it keeps the value of the last key
-    # it sees. For my purposes, a check of only top-level keys will be enough:
-    # an optional hyphen, a colon after the key.
-    # The key can be anything but a space or hyphen (to avoid catching lower-level keys)
-    pattern_for_top_level_dict_keys = re.compile(r"^(- )?(?P<key>[^\s-]+)\s?:.*")
-
-    top_level_dict_keys = [
-        pattern_for_top_level_dict_keys.match(line).group("key")  # type: ignore
-        for line in data.splitlines()
-        if pattern_for_top_level_dict_keys.match(line) is not None
-    ]
-
-    counter = Counter(top_level_dict_keys)
-    for key in counter:
-        if counter[key] > 1:
+    # it sees. For my purposes, a check of only top-level keys will be enough.
+    top_level_dict_keys: set[str] = set()
+    for line in data.splitlines():
+        match = PATTERN_FOR_TOP_LEVEL_DICT_KEYS.match(line)
+        if match is None:
+            continue
+
+        key = match.group("key")
+        if key in top_level_dict_keys:
             raise ParsingError(
                 f"File {path_to_file} contains more than one dictionary key <{key}> at"
                 " the top level"
             )
+        top_level_dict_keys.add(key)
 
     try:
-        yaml_loaded = yaml.load(data, Loader=yaml.Loader)
+        yaml_loaded = yaml.load(data, Loader=YamlLoader)
     except YamlParserError as e:
         logging.info(
             e
@@ -59,6 +68,8 @@ def check_yaml_file(path_to_file: Path, verbose: bool = True) -> None:
     if verbose:
         logging.info(f"TEST: YAML DATA {yaml_loaded}")
 
+    return yaml_loaded
+
 
 def read_json_toml_yaml(path_to_file: Path) -> Union[dict[str, Any], list[str]]:
     if not path_to_file.exists():
@@ -70,22 +81,22 @@ def read_json_toml_yaml(path_to_file: Path) -> Union[dict[str, Any], list[str]]:
 
     error_msg = f"Could not read file {path_to_file} because of malformed data"
 
-    with path_to_file.open(encoding="utf-8") as fh:
-        content = fh.read()
-
     if extension == "json":
+        with path_to_file.open(encoding="utf-8") as fh:
+            content = fh.read()
         try:
             data = json.loads(content)
         except json.JSONDecodeError:
             raise ParsingError(error_msg)
     elif extension == "toml":
-        try:
-            data = toml.loads(content)
-        except toml.TomlDecodeError:
-            raise ParsingError(error_msg)
+        with path_to_file.open(mode="rb") as fh:
+            try:
+                data = tomllib.load(fh)
+            except tomllib.TOMLDecodeError:
+                raise ParsingError(error_msg)
     elif extension == "yaml":
-        check_yaml_file(path_to_file=path_to_file)  # error will be raised there in case of error
-        data = yaml.load(content, Loader=yaml.Loader)
+        # error will be raised there in case of error
+        data = check_yaml_file(path_to_file=path_to_file)
     else:
         raise TypeError(f"File {path_to_file.name} cannot be converted")
 
@@ -1,7 +1,10 @@
 import logging
-import re
+import shutil
+import sys
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Literal, Union
+from tempfile import NamedTemporaryFile
+from typing import IO, Literal, Union
 
 
 def check_encoding_of_file(file: Path) -> str:
@@ -9,14 +12,14 @@ def check_encoding_of_file(file: Path) -> str:
     or ANSI (older ones). This function checks only these two
     alternatives.
     """
+    content = file.read_bytes()
+
     encoding = "utf-8-sig"
     try:
-        with file.open(encoding="utf-8") as fh:
-            fh.read()
+        content.decode("utf-8")
     except UnicodeDecodeError:
-        with file.open(encoding="cp1251") as fh:
-            fh.read()
-            encoding = "cp1251"
+        content.decode("cp1251")
+        encoding = "cp1251"
 
     return encoding
 
@@ -28,29 +31,34 @@ def read_non_empty_lines_from_txt_file(path_to_file: Path) -> list[str]:
     if not path_to_file.exists():
         raise FileNotFoundError(f"Файл {path_to_file} не найден")
 
-    encoding = check_encoding_of_file(path_to_file)
-
-    with path_to_file.open(encoding=encoding) as fh:
-        return [line.strip() for line in fh if line.strip()]
+    # Not using check_encoding_of_file() to avoid reading the file more than once
+    try:
+        with path_to_file.open(encoding="utf-8-sig") as fh:
+            return [stripped for line in fh if (stripped := line.strip())]
+    except UnicodeDecodeError:
+        with path_to_file.open(encoding="cp1251") as fh:
+            return [stripped for line in fh if (stripped := line.strip())]
 
 
 def read_plain_text_from_file(path_to_file: Path) -> str:
+    # File is read in one go, and if it's not in UTF-8, decoded again without re-reading
+    raw_content = path_to_file.read_bytes()
+
     try:
-        with path_to_file.open(encoding="utf-8-sig") as fh:
-            content = fh.read()
+        content = raw_content.decode("utf-8-sig")
     except UnicodeDecodeError:
         logging.info(f"Note: file {path_to_file.name} has ANSI encoding")
-        with path_to_file.open(encoding="cp1251") as fh:
-            content = fh.read()
+        content = raw_content.decode("cp1251")
 
-    return content
+    # same newline translation as reading in text mode would do
+    return content.replace("\r\n", "\n").replace("\r", "\n")
 
 
 def remove_extra_space(str_: str) -> str:
     """Removes leading and trailing space,
     replaces multiple spaces within string with one.
     """
-    return re.sub(r"\s+", " ", str_.strip())
+    return " ".join(str_.split())
 
 
 def write_plain_text_to_file(
@@ -73,7 +81,8 @@ def write_plain_text_to_file(
             fh.write(content)
             msg = "characters"
         elif isinstance(content, (list, tuple)):
-            fh.writelines(f"{line}{newline_char}" for line in content)
+            if content:
+                fh.write(newline_char.join(content) + newline_char)
             msg = "lines"
 
         logging.info(f"Written {len(content)} {msg} into file {file}.")
@@ -87,31 +96,94 @@ def move_line(
 ) -> None:
     """Cut one line and insert it before the other."""
 
-    with file.open(encoding="utf-8") as fh:
-        lines = fh.readlines()
-
-        if isinstance(line_number_to_insert_before, str) and line_number_to_insert_before in (
-            "end",
-            "END",
-        ):
-            line_number_to_insert_before = len(lines)
-        elif not isinstance(line_number_to_insert_before, int):
-            raise TypeError(
-                f"{line_number_to_insert_before} is not an accepted argument. "
-                'Please pass an integer or the string "END".'
-            )
-
-        lines.insert(
-            line_number_to_insert_before,
-            lines[line_number_to_cut],
+    insert_before: int
+    if line_number_to_insert_before in ("end", "END"):
+        insert_before = sys.maxsize  # i.e. after the last line
+    elif isinstance(line_number_to_insert_before, int):
+        insert_before = line_number_to_insert_before
+    else:
+        raise TypeError(
+            f"{line_number_to_insert_before} is not an accepted argument. "
+            'Please pass an integer or the string "END".'
         )
 
-        if line_number_to_insert_before > line_number_to_cut:
-            lines.pop(line_number_to_cut)
+    if line_number_to_cut < 0 or insert_before < 0:
+        # negative line numbers count from the end, like list indices
+        with file.open(encoding="utf-8") as fh:
+            number_of_lines = sum(1 for _ in fh)
+
+        if line_number_to_cut < 0:
+            line_number_to_cut += number_of_lines
+            if line_number_to_cut < 0:
+                raise IndexError(
+                    f"Line number {line_number_to_cut - number_of_lines} is out of range"
+                )
+
+        if insert_before < 0:
+            insert_before = max(insert_before + number_of_lines, 0)
+
+    file = file.resolve()  # a symlinked file is edited, not replaced with a regular file
+
+    if output_file is not None and not (output_file.exists() and output_file.samefile(file)):
+        with file.open(encoding="utf-8") as lines, output_file.open("w", encoding="utf-8") as fh:
+            _write_lines_with_one_line_moved(
+                lines=lines,
+                output_fh=fh,
+                line_number_to_cut=line_number_to_cut,
+                line_number_to_insert_before=insert_before,
+            )
+        return
+
+    # Lines are streamed into a temporary file which then replaces the file,
+    # so the whole file is never held in memory and can be safely overwritten.
+    with NamedTemporaryFile(mode="w", encoding="utf8", dir=file.parent, delete=False) as output_fh:
+        tmp_file = Path(output_fh.name)
+        try:
+            with file.open(encoding="utf-8") as input_fh:
+                _write_lines_with_one_line_moved(
+                    lines=input_fh,
+                    output_fh=output_fh,
+                    line_number_to_cut=line_number_to_cut,
+                    line_number_to_insert_before=insert_before,
+                )
+        except BaseException:
+            output_fh.close()
+            tmp_file.unlink()
+            raise
+
+    # temporary file is only accessible by owner
+    shutil.copymode(file, tmp_file)
+    tmp_file.replace(file)
+
+
+def _write_lines_with_one_line_moved(
+    lines: Iterable[str],
+    output_fh: IO[str],
+    line_number_to_cut: int,
+    line_number_to_insert_before: int,
+) -> None:
+    line_to_move = None
+    is_line_to_move_written = False
+    # If the line moves up, lines between its new and old positions have to wait for it
+    lines_to_shift: list[str] = []
+
+    for line_number, line in enumerate(lines):
+        if line_number == line_number_to_cut:
+            line_to_move = line
+            if line_number_to_insert_before <= line_number_to_cut:
+                output_fh.write(line)
+                output_fh.writelines(lines_to_shift)
+                is_line_to_move_written = True
+        elif line_number_to_insert_before <= line_number < line_number_to_cut:
+            lines_to_shift.append(line)
         else:
-            lines.pop(line_number_to_cut + 1)
+            if line_number == line_number_to_insert_before:
+                output_fh.write(line_to_move)  # type: ignore  # line to cut was above
+                is_line_to_move_written = True
+            output_fh.write(line)
 
-    file_to_write = output_file or file
+    if line_to_move is None:
+        raise IndexError(f"Line number {line_number_to_cut} is out of range")
 
-    with file_to_write.open(mode="w+", encoding="utf8") as fh:
-        fh.writelines(lines)
+    if not is_line_to_move_written:
+        output_fh.write(line_to_move)